@@ -21,8 +21,10 @@ class Ensemble(Exporter, metaclass=EnsembleMeta):
         model_fn: type(None),
         output_names: Optional[Sequence[str]] = None,
     ):
-        shapes = {x.name: list(x.dims) for x in self.config.output}
-        return shapes or None
+        outputs = self.config.output
+        if not outputs:
+            return None
+        return {x.name: list(x.dims) for x in outputs}
 
     def export(self, model_fn, export_path):
         self.fs.write("", export_path)